@@ -1,136 +1,145 @@
-import re
 import json
-
-class ErrInvalidParam(Exception):
-    """Custom exception class for invalid parameter handling.
-    
-    Attributes:
-        value (any): The invalid parameter that caused the exception.
-        msg (str): A message describing the error.
-    """
-    def __init__(self, value=None, msg=None) -> None:
-        if not msg:
-            msg = f"Invalid parameter found, please validate.\nValue: {value}"
-        super().__init__(msg)
-
-def handle_data(data) -> any:
-    """Handles and validates the input data, raising an error if required fields are missing.
+from collections.abc import Callable
+
+# Adquirences whose logic number is zero-padded to 15 digits before validation.
+_ZFILL15: frozenset[str] = frozenset({
+    "bin", "fitcard", "getnetlac", "policard", "safra", "sipag", "siscred", "softnex", "valeshop"
+})
+
+def _is_n_digits(value: str, n: int) -> bool:
+    """Checks that value has exactly n decimal digits (same as ``^\\d{n}$``)."""
+    return len(value) == n and value.isdecimal()
+
+def _is_alnum_n(value: str, n: int) -> bool:
+    """Checks that value has exactly n ASCII letters or digits (same as ``^[a-zA-Z0-9]{n}$``)."""
+    return len(value) == n and value.isascii() and value.isalnum()
+
+def _is_prefixed_digits(value: str, prefix: str, n: int) -> bool:
+    """Checks that value has n characters, starts with prefix and the rest are decimal digits."""
+    return len(value) == n and value.startswith(prefix) and value[len(prefix):].isdecimal()
+
+def _is_tf_code(code: str) -> bool:
+    """Checks the ``^TF[a-zA-Z0-9]{8}$`` code pattern."""
+    return len(code) == 10 and code.startswith("TF") and code[2:].isascii() and code[2:].isalnum()
+
+def _validate_15_digits(adquirence: str, logic_number: str, code: str) -> dict[str, object]:
+    """Validates adquirences that only require a 15-digit logic number."""
+    if _is_n_digits(logic_number, 15):
+        return {"Success": True, "adquirence": adquirence, "logic_number": logic_number}
+    return {"Failure": f"{adquirence.upper()} does not match with the pattern"}
+
+def _validate_15_digits_and_tf_code(adquirence: str, logic_number: str, code: str) -> dict[str, object]:
+    """Validates adquirences that require a 15-digit logic number and a TF code."""
+    if _is_n_digits(logic_number, 15) and _is_tf_code(code):
+        return {"Success": True, "adquirence": adquirence, "logic_number": logic_number, "code": code}
+    return {"Failure": f"{adquirence.upper()} does not match with the pattern"}
+
+def _validate_cielo(adquirence: str, logic_number: str, code: str) -> dict[str, object]:
+    """Validates a Cielo logic number (8 digits starting with 4)."""
+    if _is_prefixed_digits(logic_number, "4", 8):
+        return {"Success": True, "adquirence": adquirence, "logic_number": logic_number}
+    return {"Failure": f"{adquirence.upper()} does not match with the pattern"}
+
+def _validate_stone(adquirence: str, logic_number: str, code: str) -> dict[str, object]:
+    """Validates a Stone logic number (32 alphanumerics) and code (9 digits)."""
+    if _is_alnum_n(logic_number, 32) and _is_n_digits(code, 9):
+        return {"Success": True, "adquirence": adquirence, "logic_number": logic_number, "code": code}
+    return {"Failure": f"{adquirence.upper()} does not match with the pattern"}
+
+def _validate_vero(adquirence: str, logic_number: str, code: str) -> dict[str, object]:
+    """Validates a Vero logic number (15 digits starting with 04) and code (11 digits)."""
+    if _is_prefixed_digits(logic_number, "04", 15) and _is_n_digits(code, 11):
+        return {"Success": True, "adquirence": adquirence, "logic_number": logic_number, "code": code}
+    return {"Failure": f"{adquirence.upper()} does not match with the pattern"}
+
+# Maps each supported adquirence to the function that validates its logic number and code.
+_VALIDATORS: dict[str, Callable[[str, str, str], dict[str, object]]] = {
+    **dict.fromkeys((
+        "adiq", "bigcard", "biz", "brasil card", "cabal", "cardse", "carto", "comprocard",
+        "convcard", "credishop", "ctf frota", "fitcard", "globalpayments", "marketpay",
+        "mettacard", "orgcard", "portalcard", "rede", "resomaq", "softnex", "telenet",
+        "valecard", "valeshop"
+    ), _validate_15_digits),
+    **dict.fromkeys(("bin", "getnetlac", "safra", "sipag"), _validate_15_digits_and_tf_code),
+    "cielo": _validate_cielo,
+    "stone": _validate_stone,
+    "vero": _validate_vero,
+}
+
+def format_success(result: dict[str, object]) -> str:
+    """Builds the human readable message for a successful validation result.
 
     Args:
-        data (dict): A dictionary containing 'adquirente', 'logico', and 'codigo' keys.
+        result (dict): A "Success" dictionary returned by validate_logic_number.
 
     Returns:
-        tuple: A tuple containing 'adquirente', 'logico', and 'codigo' if all are valid.
-        str: Error message if validation fails.
+        str: A message describing the processed adquirence, logic number and code.
 
     Raises:
-        ErrInvalidParam: If any required parameter ('adquirente', 'logico', or 'codigo') is missing.
-    """    
-    try:
-        adquirence = data.get("adquirente")
-        logic_number = data.get("logico")
-        code = data.get("codigo")
-        
-        if not adquirence:
-            raise ErrInvalidParam(adquirence, "Authorizer not provided.")
-        elif not logic_number:
-            raise ErrInvalidParam(logic_number, "Logical number not provided.")
-        elif not code:
-            raise ErrInvalidParam(code, "Code not provided")
-
-    except ErrInvalidParam as e:
-        return str(e)
-
-    adquirence_lower = adquirence.lower()
-    valid_adquirences = {
-        "bin", "getnetlac", "safra", "sipag", "stone", "vero", "adiq", "bigcard", "biz", 
-        "brasil card", "cabal", "cardse", "carto", "comprocard", "convcard", "credishop", 
-        "ctf frota", "fitcard", "globalpayments", "marketpay", "mettacard", "orgcard", 
-        "portalcard", "rede", "resomaq", "softnex", "telenet", "valecard", "valeshop", "cielo"
-    }
-    
-    if adquirence_lower in valid_adquirences:
-        return adquirence_lower, logic_number, code
-    else:
-        return "unsupported adquirence type"
-
-def process_data(adquirence, logic_number) -> str:
-    """Processes the logic number based on the adquirence rules.
-
-    Args:
-        adquirence (str): The name of the adquirence.
-        logic_number (str): The logical number provided for the adquirence.
-
-    Returns:
-        str: Processed logical number, potentially zero-padded for some adquirences.
+        ValueError: If result is not a "Success" result.
     """
-    match adquirence:
-        case "bin" | "fitcard" | "getnetlac" | "policard" | "safra" | "sipag" | "siscred" | "softnex" | "valeshop":
-            return logic_number.zfill(15)
-        case _: 
-            return logic_number
-
-def validate_logic_number(data) -> dict:
+    if "Success" not in result:
+        raise ValueError(f"Expected a successful validation result, got: {result}")
+    message = f"{result['adquirence']} processed with logic number {result['logic_number']}"
+    if "code" in result:
+        message = f"{message} and code {result['code']}"
+    return message
+
+def validate_logic_number(data: object) -> dict[str, object]:
     """Validates the logical number and code for a given adquirence, ensuring they match specific patterns.
 
     Args:
-        data (dict): A dictionary containing 'adquirente', 'logico', and 'codigo' keys.
+        data (object): The input to validate, expected to be a dictionary containing 'adquirente', 'logico',
+            and 'codigo' keys. Anything else gets an "Error" result.
 
     Returns:
         dict: A dictionary containing success or failure messages based on the validation.
         The returned dictionary may have:
-            - "Success" if the validation passes.
+            - "Success" (True) if the validation passes, along with "adquirence", "logic_number"
+              and, when it is checked, "code". Use format_success to get a readable message.
             - "Failure" if the data doesn't match the expected pattern.
             - "Error" for unsupported adquirences or invalid input data.
-    
+
     Raises:
-        TypeError: If the input data is not a dictionary.
+        Exception: Unexpected errors (e.g. non-string values) are not caught here,
+        use safe_validate_logic_number to get them as an "Error" dictionary.
+    """
+    if not isinstance(data, dict):
+        return {"Error": "Invalide param: The argument must be a JSON dictionary."}
+
+    adquirence = data.get("adquirente")
+    logic_number = data.get("logico")
+    code = data.get("codigo")
+
+    if not adquirence:
+        return {"Error": "Authorizer not provided."}
+    elif not logic_number:
+        return {"Error": "Logical number not provided."}
+    elif not code:
+        return {"Error": "Code not provided"}
+
+    adquirence = adquirence if adquirence.islower() else adquirence.lower()
+    validator = _VALIDATORS.get(adquirence)
+    if validator is None:
+        return {"Error": "unsupported adquirence type"}
+
+    if adquirence in _ZFILL15 and len(logic_number) < 15:
+        logic_number = logic_number.zfill(15)
+
+    return validator(adquirence, logic_number, code)
+
+def safe_validate_logic_number(data: object) -> dict[str, object]:
+    """Same as validate_logic_number, but returns unexpected errors as an "Error" dictionary instead of raising.
+
+    Args:
+        data (object): The input to validate, expected to be a dictionary containing 'adquirente', 'logico',
+            and 'codigo' keys. Anything else gets an "Error" result.
+
+    Returns:
+        dict: The validate_logic_number result, or an "Error" dictionary if it raised.
     """
     try:
-        if not isinstance(data, dict):
-            raise TypeError("The argument must be a JSON dictionary.")
-        
-        result = handle_data(data)
-        if isinstance(result, tuple):
-            adquirence, logic_number, code = result
-        else:
-            return {"Error": result}
-
-        logic_number = process_data(adquirence, logic_number)
-        
-        
-        
-        match adquirence:
-            case "adiq" | "bigcard" | "biz" | "brasil card" | "cabal" | "cardse" | "carto" | "comprocard" | "convcard" | "credishop" | "ctf frota" | "fitcard" | "globalpayments" | "marketpay" | "mettacard" | "orgcard" | "portalcard" | "rede" | "resomaq" | "softnex" | "telenet" | "valecard" | "valeshop":
-                if re.match(r"^\d{15}$", logic_number):
-                    return {"Success": f"{adquirence} processed with logic number {logic_number}"}
-
-            case "bin" | "getnetlac" | "safra" | "sipag":
-                if re.match(r"^\d{15}$", logic_number) and re.match(r"^TF[a-zA-Z0-9]{8}$", code):
-                    return {"Success": f"{adquirence} processed with logic number {logic_number} and code {code}"}
-                else:
-                    return {"Failure":f"{adquirence.upper()} does not match with the pattern"}
-
-            case "cielo":
-                if re.match(r"^4\d{7}$", logic_number):
-                    return {"Success": f"{adquirence} processed with logic number {logic_number}"}
-                else:
-                    return {"Failure":f"{adquirence.upper()} does not match with the pattern"}
-
-            case "stone":
-                if re.match(r"^[a-zA-Z0-9]{32}$", logic_number) and re.match(r"^\d{9}$", code):
-                    return {"Success": f"{adquirence} processed with logic number {logic_number} and code {code}"}
-                else:
-                    return {"Failure":f"{adquirence.upper()} does not match with the pattern"}
-
-            case "vero":
-                if re.match(r"^04\d{13}$", logic_number) and re.match(r"^\d{11}$", code):
-                    return {"Success": f"{adquirence} processed with logic number {logic_number} and code {code}"}
-                else:
-                    return {"Failure":f"{adquirence.upper()} does not match with the pattern"}
-                
-            case _:
-                return {"Error": "Unsupported adquirence type"}
+        return validate_logic_number(data)
     except TypeError as e:
         return {"Error": f"Invalide param: {e}"}
     except Exception as e:
@@ -142,4 +151,5 @@ if __name__ == "__main__":
         "logico": "041135700123300",
         "codigo": "00411357000"
     }
-    print(validate_logic_number(test_data))
+    result = validate_logic_number(test_data)
+    print(format_success(result) if "Success" in result else result)